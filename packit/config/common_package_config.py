@@ -7,6 +7,7 @@ Common package config attributes so they can be imported both in PackageConfig a
 import warnings
 import logging
 from enum import Enum
+from functools import lru_cache
 
 from os import getenv
 from os.path import basename
@@ -22,6 +23,15 @@ from packit.constants import PROD_DISTGIT_URL, DISTGIT_NAMESPACE
 from packit.sync import SyncFilesItem, iter_srcs
 
 
+@lru_cache(maxsize=None)
+def _get_common_config_schema():
+    """Get the CommonConfigSchema instance, created on the first call."""
+    # required to avoid cyclical imports
+    from packit.schema import CommonConfigSchema
+
+    return CommonConfigSchema()
+
+
 class Deployment(Enum):
     dev = "dev"
     stg = "stg"
@@ -312,14 +322,17 @@ class CommonPackageConfig:
             return []
 
     def __repr__(self):
-        # required to avoid cyclical imports
-        from packit.schema import CommonConfigSchema
-
-        s = CommonConfigSchema()
+        s = _get_common_config_schema()
         # For __repr__() return a JSON-encoded string, by using dumps().
         # Mind the 's'!
         return f"CommonPackageConfig: {s.dumps(self)}"
 
+    def _get_attributes_to_compare(self) -> Dict[str, Any]:
+        """Get the attributes which make two configs equal."""
+        # '_downstream_project_url' is not serialized, it can be set lazily
+        # from the other attributes once 'downstream_project_url' is accessed.
+        return {k: v for k, v in vars(self).items() if k != "_downstream_project_url"}
+
     @property
     def downstream_project_url(self) -> str:
         if not self._downstream_project_url:
@@ -368,10 +381,14 @@ class CommonPackageConfig:
         files = self.files_to_sync
 
         if not self._files_to_sync_used:
-            if self.specfile_path not in iter_srcs(files):
-                files.append(self.get_specfile_sync_files_item())
-
-            if self.config_file_path and self.config_file_path not in iter_srcs(files):
+            # collect the src-s once instead of iterating the files per lookup
+            srcs = set(iter_srcs(files))
+            if self.specfile_path not in srcs:
+                specfile_item = self.get_specfile_sync_files_item()
+                files.append(specfile_item)
+                srcs.update(specfile_item.src)
+
+            if self.config_file_path and self.config_file_path not in srcs:
                 # this relative because of glob: "Non-relative patterns are unsupported"
                 files.append(
                     SyncFilesItem(
@@ -1,18 +1,26 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from copy import deepcopy
 from enum import Enum
-from logging import getLogger
+from functools import lru_cache
+from logging import DEBUG, getLogger
 from typing import List, Dict
 
 from packit.config.aliases import DEFAULT_VERSION
 from packit.config.common_package_config import CommonPackageConfig
-from packit.exceptions import PackitConfigException
 
 logger = getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_job_config_schema():
+    """Get the JobConfigSchema instance shared by all the JobConfigs."""
+    # required to avoid cyclical imports
+    from packit.schema import JobConfigSchema
+
+    return JobConfigSchema()
+
+
 class JobType(Enum):
     """Type of the job used by users in the config"""
 
@@ -56,57 +64,51 @@ class JobConfig(CommonPackageConfig):
         self.trigger: JobConfigTriggerType = trigger
 
     def __repr__(self):
-        # required to avoid cyclical imports
-        from packit.schema import JobConfigSchema
+        # repr is often formatted eagerly (logs, exceptions), keep it cheap
+        return f"JobConfig(type={self.type.value!r}, trigger={self.trigger.value!r})"
 
-        s = JobConfigSchema()
-        # For __repr__() return a JSON-encoded string, by using dumps().
-        # Mind the 's'!
-        return f"JobConfig: {s.dumps(self)}"
+    def to_json(self) -> str:
+        """Serialize the job config to a JSON-encoded string."""
+        # Mind the 's' in dumps()!
+        return _get_job_config_schema().dumps(self)
 
     @classmethod
     def get_from_dict(cls, raw_dict: dict) -> "JobConfig":
-        # required to avoid cyclical imports
-        from packit.schema import JobConfigSchema
-
-        config = JobConfigSchema().load(raw_dict)
-        logger.debug(f"Loaded config: {config}")
+        config = _get_job_config_schema().load(raw_dict)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Loaded config: {config.to_json()}")
 
         return config
 
     def __eq__(self, other: object):
+        if self is other:
+            return True
         if not isinstance(other, JobConfig):
-            raise PackitConfigException("Provided object is not a JobConfig instance.")
-        # required to avoid cyclical imports
-        from packit.schema import JobConfigSchema
-
-        s = JobConfigSchema()
-        # Compare the serialized objects.
-        return s.dump(self) == s.dump(other)
+            return NotImplemented
+        # Compare the attributes directly, serializing both objects is expensive.
+        return self._get_attributes_to_compare() == other._get_attributes_to_compare()
 
 
 def get_default_jobs() -> List[Dict]:
     """
     this returns a list of dicts so it can be properly parsed and defaults would be set
     """
-    # deepcopy = list and dict are mutable, we want to make sure
-    # no one will mutate the default jobs (hello tests)
-    return deepcopy(
-        [
-            {
-                "job": "copr_build",
-                "trigger": "pull_request",
-                "targets": [DEFAULT_VERSION],
-            },
-            {
-                "job": "tests",
-                "trigger": "pull_request",
-                "targets": [DEFAULT_VERSION],
-            },
-            {
-                "job": "propose_downstream",
-                "trigger": "release",
-                "dist_git_branches": ["fedora-all"],
-            },
-        ]
-    )
+    # list and dict are mutable, the literal creates new objects on every call
+    # so no one will mutate the default jobs (hello tests)
+    return [
+        {
+            "job": "copr_build",
+            "trigger": "pull_request",
+            "targets": [DEFAULT_VERSION],
+        },
+        {
+            "job": "tests",
+            "trigger": "pull_request",
+            "targets": [DEFAULT_VERSION],
+        },
+        {
+            "job": "propose_downstream",
+            "trigger": "release",
+            "dist_git_branches": ["fedora-all"],
+        },
+    ]
@@ -8,9 +8,21 @@ class PullRequestNotificationsConfig:
     def __init__(self, successful_build: bool = False):
         self.successful_build = successful_build
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PullRequestNotificationsConfig):
+            return NotImplemented
+
+        return self.successful_build == other.successful_build
+
 
 class NotificationsConfig:
     """Configuration of notifications."""
 
     def __init__(self, pull_request: PullRequestNotificationsConfig):
         self.pull_request = pull_request
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NotificationsConfig):
+            return NotImplemented
+
+        return self.pull_request == other.pull_request
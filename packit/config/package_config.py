@@ -1,14 +1,33 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import hashlib
 import json
 import logging
+import os
+import tempfile
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional, List, Dict, Union, Set
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    Optional,
+    List,
+    Dict,
+    Union,
+    Set,
+    Tuple,
+    Type,
+)
 
 from ogr.abstract import GitProject
 from ogr.exceptions import GithubAppNotInstalledError
-from yaml import safe_load
+import yaml
 
 from packit.config.common_package_config import CommonPackageConfig
 from packit.config.job_config import JobConfig, JobType
@@ -17,6 +36,32 @@ from packit.exceptions import PackitConfigException
 
 logger = logging.getLogger(__name__)
 
+# libyaml bindings might not be available, fallback to the pure Python loader
+_SafeLoader: Type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML content of packit configs: key -> (stamp, parsed content).
+# The stamp is used to find out whether the cached content is still valid.
+_YAML_CACHE: "OrderedDict[Hashable, Tuple[Hashable, Any]]" = OrderedDict()
+_YAML_CACHE_MAX_SIZE = 100
+
+_SPECFILE_REGEX = r".+\.spec$"
+
+# (dir, mtime of dir, excluded dirs) -> spec file found in dir
+_SPECFILE_CACHE: "OrderedDict[Tuple[str, int, FrozenSet[str]], str]" = OrderedDict()
+_SPECFILE_CACHE_MAX_SIZE = 100
+
+
+@lru_cache(maxsize=None)
+def _get_package_config_schema():
+    """
+    Get the PackageConfigSchema instance shared by all the PackageConfigs,
+    constructing the schema is expensive so it's done only once.
+    """
+    # required to avoid cyclical imports
+    from packit.schema import PackageConfigSchema
+
+    return PackageConfigSchema()
+
 
 class PackageConfig(CommonPackageConfig):
     """
@@ -36,10 +81,7 @@ class PackageConfig(CommonPackageConfig):
         self.jobs: List[JobConfig] = jobs or []
 
     def __repr__(self):
-        # required to avoid cyclical imports
-        from packit.schema import PackageConfigSchema
-
-        s = PackageConfigSchema()
+        s = _get_package_config_schema()
         # For __repr__() return a JSON-encoded string, by using dumps().
         # Mind the 's'!
         return f"PackageConfig: {s.dumps(self)}"
@@ -53,9 +95,6 @@ class PackageConfig(CommonPackageConfig):
         search_specfile: Optional[Callable[..., Optional[str]]] = None,
         **specfile_search_args,
     ) -> "PackageConfig":
-        # required to avoid cyclical imports
-        from packit.schema import PackageConfigSchema
-
         if config_file_path and not raw_dict.get("config_file_path", None):
             raw_dict.update(config_file_path=config_file_path)
 
@@ -76,7 +115,7 @@ class PackageConfig(CommonPackageConfig):
             elif search_specfile:
                 raw_dict["specfile_path"] = search_specfile(**specfile_search_args)
 
-        package_config = PackageConfigSchema().load(raw_dict)
+        package_config = _get_package_config_schema().load(raw_dict)
 
         return package_config
 
@@ -108,18 +147,121 @@ class PackageConfig(CommonPackageConfig):
         return set()
 
     def __eq__(self, other: object):
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return NotImplemented
-        # required to avoid cyclical imports
-        from packit.schema import PackageConfigSchema
+        # Compare the attributes directly, serializing both objects is expensive.
+        attributes_self = self._get_attributes_to_compare()
+        attributes_other = other._get_attributes_to_compare()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"our configuration:\n{attributes_self}")
+            logger.debug(f"the other configuration:\n{attributes_other}")
+        return attributes_self == attributes_other
+
 
-        s = PackageConfigSchema()
-        # Compare the serialized objects.
-        serialized_self = s.dump(self)
-        serialized_other = s.dump(other)
-        logger.debug(f"our configuration:\n{serialized_self}")
-        logger.debug(f"the other configuration:\n{serialized_other}")
-        return serialized_self == serialized_other
+def _load_yaml_cached(key: Hashable, stamp: Hashable, load: Callable[[], Any]) -> Any:
+    """
+    Load YAML content using the LRU cache of parsed configs.
+
+    :param key: identification of the config (e.g. its path)
+    :param stamp: value identifying the current version of the config,
+        the cached content is used only if its stamp is the same
+    :param load: callable parsing the config, called on a cache miss
+    :return: a copy of the parsed content, so callers are free to mutate it
+    """
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        _YAML_CACHE.move_to_end(key)
+        return deepcopy(cached[1])
+
+    loaded = load()
+    _YAML_CACHE[key] = (stamp, loaded)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return deepcopy(loaded)
+
+
+def _get_config_cache_path(config_file_path: Path) -> Path:
+    """
+    Get the path where the parsed content of the config is cached as JSON.
+
+    The cache lives outside the repository (in $XDG_CACHE_HOME/packit/)
+    so that it doesn't end up in commits or synced files.
+
+    :param config_file_path: path to the config
+    :return: path to the JSON cache file
+    """
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        directory = Path(xdg_cache_home)
+    else:
+        directory = Path.home() / ".cache"
+    config_hash = hashlib.sha256(str(config_file_path.resolve()).encode()).hexdigest()
+    return directory / "packit" / f"{config_hash}.json"
+
+
+def _parse_config_file(config_file_path: Path) -> Any:
+    """
+    Parse the YAML content of the config file.
+
+    If PACKIT_CONFIG_CACHE=1 is set in the environment, the parsed content is
+    also stored as JSON in the user's cache directory, which is then read
+    instead of the config as long as the config's mtime and size stay the same.
+
+    :param config_file_path: path to the config
+    :return: parsed content of the config
+    """
+    # libyaml decodes the content itself, no need to decode it in Python first
+    if os.getenv("PACKIT_CONFIG_CACHE") != "1":
+        return yaml.load(config_file_path.read_bytes(), Loader=_SafeLoader)
+
+    cache_path = _get_config_cache_path(config_file_path)
+    config_stat = config_file_path.stat()
+    # Don't compare the mtimes of the cache and the config, they can be on
+    # different filesystems and the config can be restored with an old mtime.
+    stamp = [config_stat.st_mtime_ns, config_stat.st_size]
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["stamp"] == stamp:
+            return cached["content"]
+    except (OSError, ValueError, TypeError, KeyError):
+        # missing or broken cache, parse the config itself
+        pass
+
+    loaded_config = yaml.load(config_file_path.read_bytes(), Loader=_SafeLoader)
+
+    try:
+        content = json.dumps({"stamp": stamp, "content": loaded_config})
+    except (TypeError, ValueError):
+        content = None
+    # YAML types which can't be represented in JSON (e.g. dates, non-string keys)
+    if content is None or json.loads(content)["content"] != loaded_config:
+        logger.debug(f"Config {config_file_path} can't be cached as JSON.")
+        return loaded_config
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f"{cache_path.name}."
+        )
+    except OSError as ex:
+        logger.debug(f"Cannot store the parsed config to {cache_path}: {ex!r}")
+        return loaded_config
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(content)
+        # mkstemp() creates the file readable by the owner only, keep it
+        # that way, configs can contain secrets (e.g. in env or actions).
+        # Replace the cache atomically so that no one reads a partial content.
+        os.replace(tmp_path, cache_path)
+    except OSError as ex:
+        logger.debug(f"Cannot store the parsed config to {cache_path}: {ex!r}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    return loaded_config
 
 
 def find_packit_yaml(
@@ -144,20 +286,24 @@ def find_packit_yaml(
             "Ambiguous usage of 'try_local_dir_first' and 'try_local_dir_last'."
         )
 
-    if try_local_dir_first:
-        if cwd in directories:
-            directories.remove(cwd)
-        directories.insert(0, cwd)
-
-    if try_local_dir_last:
-        if cwd in directories:
-            directories.remove(cwd)
-        directories.append(cwd)
+    if try_local_dir_first or try_local_dir_last:
+        other_dirs = [config_dir for config_dir in directories if config_dir != cwd]
+        # when both are set, try_local_dir_last wins, as it always did
+        directories = other_dirs + [cwd] if try_local_dir_last else [cwd] + other_dirs
 
     for config_dir in directories:
+        # list the directory once instead of checking every candidate
+        try:
+            with os.scandir(config_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
         for config_file_name in CONFIG_FILE_NAMES:
             config_file_name_full = config_dir / config_file_name
-            if config_file_name_full.is_file():
+            # config files in subdirectories (.distro/) are not listed
+            if config_file_name in present or (
+                "/" in config_file_name and config_file_name_full.is_file()
+            ):
                 logger.debug(f"Local package config found: {config_file_name_full}")
                 return config_file_name_full
     raise PackitConfigException("No packit config found.")
@@ -170,9 +316,17 @@ def load_packit_yaml(config_file_path: Path) -> Dict:
     :return: Dict with the file content
     """
     try:
-        # safe_load() returns None when the file is empty, but this needs
+        stat = config_file_path.stat()
+        # yaml.load() returns None when the file is empty, but this needs
         # to return a dict.
-        return safe_load(config_file_path.read_text()) or {}
+        return (
+            _load_yaml_cached(
+                key=str(config_file_path.resolve()),
+                stamp=(stat.st_mtime_ns, stat.st_size),
+                load=lambda: _parse_config_file(config_file_path),
+            )
+            or {}
+        )
     except Exception as ex:
         logger.error(f"Cannot load package config {config_file_path}.")
         raise PackitConfigException(f"Cannot load package config: {ex!r}.")
@@ -243,7 +397,12 @@ def get_package_config_from_repo(
         return None
 
     try:
-        loaded_config = safe_load(config_file_content)
+        # the content is fetched anyway, use it as the stamp as refs can move
+        loaded_config = _load_yaml_cached(
+            key=(project.full_repo_name, ref, config_file_name),
+            stamp=config_file_content,
+            load=lambda: yaml.load(config_file_content, Loader=_SafeLoader),
+        )
     except Exception as ex:
         logger.error(f"Cannot load package config {config_file_name!r}. {ex}")
         raise PackitConfigException(
@@ -269,7 +428,8 @@ def parse_loaded_config(
     **specfile_search_args,
 ) -> PackageConfig:
     """Tries to parse the config to PackageConfig."""
-    logger.debug(f"Package config:\n{json.dumps(loaded_config, indent=4)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Package config:\n{json.dumps(loaded_config, indent=4)}")
 
     try:
         return PackageConfig.get_from_dict(
@@ -292,17 +452,40 @@ def get_local_specfile_path(dir: Path, exclude: List[str] = None) -> Optional[st
     :param exclude: don't include files found in these dirs (default "tests")
     :return: path (relative to dir) of the first found spec file
     """
-    files = [path.relative_to(dir) for path in dir.glob("*.spec")] or [
-        path.relative_to(dir) for path in dir.rglob("*.spec")
-    ]
-
     # Don't take files found in exclude
-    sexclude = set(exclude) if exclude else {"tests"}
-    files = [f for f in files if f.parts[0] not in sexclude]
+    sexclude = frozenset(exclude) if exclude else frozenset({"tests"})
+
+    def first_spec(paths: Iterator[Path]) -> Optional[Path]:
+        return next(
+            (
+                path.relative_to(dir)
+                for path in paths
+                if path.relative_to(dir).parts[0] not in sexclude
+            ),
+            None,
+        )
+
+    try:
+        # Only spec files found in dir directly are cached, mtime of dir
+        # doesn't change when files in its subdirectories change.
+        key = (str(dir.resolve()), dir.stat().st_mtime_ns, sexclude)
+    except FileNotFoundError:
+        return None
+    if key in _SPECFILE_CACHE:
+        _SPECFILE_CACHE.move_to_end(key)
+        return _SPECFILE_CACHE[key]
+
+    specfile = first_spec(dir.glob("*.spec"))
+    if specfile:
+        _SPECFILE_CACHE[key] = str(specfile)
+        if len(_SPECFILE_CACHE) > _SPECFILE_CACHE_MAX_SIZE:
+            _SPECFILE_CACHE.popitem(last=False)
+    else:
+        specfile = first_spec(dir.rglob("*.spec"))
 
-    if len(files) > 0:
-        logger.debug(f"Local spec files found: {files}. Taking: {files[0]}")
-        return str(files[0])
+    if specfile:
+        logger.debug(f"Local spec file found: {specfile}")
+        return str(specfile)
 
     return None
 
@@ -314,7 +497,7 @@ def get_specfile_path_from_repo(project: GitProject, ref: str = None) -> Optiona
     :param ref: git ref (defaults to repo's default branch)
     :return: str path of the spec file or None
     """
-    spec_files = project.get_files(ref=ref, filter_regex=r".+\.spec$")
+    spec_files = project.get_files(ref=ref, filter_regex=_SPECFILE_REGEX)
 
     if not spec_files:
         logger.debug(f"No spec file found in {project.full_repo_name!r}")
@@ -44,16 +44,10 @@ class Status:
         :param number_of_prs: int
         :return: List of downstream PRs
         """
-        table: List[Tuple[int, str, str]] = []
         pr_list = self.dg.local_project.git_project.get_pr_list()
         logger.debug("Downstream PRs fetched.")
-        if len(pr_list) > 0:
-            # take last `number_of_prs` PRs
-            pr_list = (
-                pr_list[:number_of_prs] if len(pr_list) > number_of_prs else pr_list
-            )
-            table = [(pr.id, pr.title, pr.url) for pr in pr_list]
-        return table
+        # take last `number_of_prs` PRs
+        return [(pr.id, pr.title, pr.url) for pr in pr_list[:number_of_prs]]
 
     def get_dg_versions(self) -> Dict:
         """
@@ -118,12 +112,18 @@ class Status:
             packageID=package_id,
             state=BUILD_STATES["COMPLETE"],
             completeAfter=since.timestamp(),
+            # newest builds first, the first build of each branch is kept below
+            queryOpts={"order": "-completion_time"},
         )
-        logger.debug(f"Recent Koji builds fetched: {[b['nvr'] for b in builds_l]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Recent Koji builds fetched: {[b['nvr'] for b in builds_l]}")
         # Select latest build for each branch.
-        # [{'nvr': 'python-ogr-0.5.0-1.fc29'}, {'nvr':'python-ogr-0.6.0-1.fc29'}]
+        # [{'nvr':'python-ogr-0.6.0-1.fc29'}, {'nvr': 'python-ogr-0.5.0-1.fc29'}]
         # -> {'fc29': 'python-ogr-0.6.0-1.fc29'}
-        return {b["nvr"].rsplit(".", 1)[1]: b["nvr"] for b in reversed(builds_l)}
+        latest_builds: Dict[str, str] = {}
+        for build in builds_l:
+            latest_builds.setdefault(build["nvr"].rsplit(".", 1)[1], build["nvr"])
+        return latest_builds
 
     def get_updates(self, number_of_updates: int = 3) -> List:
         """
@@ -132,38 +132,53 @@ class Status:
         :return: None
         """
         bodhi_client = get_bodhi_client()
-        updates = []
-        page = pages = 1
-        while page <= pages:
-            results = bodhi_client.query(
-                packages=self.dg.package_config.downstream_package_name,
-                page=page,
-            )
-            updates.extend(results["updates"])
+        package_name = self.dg.package_config.downstream_package_name
+        updates: List[List] = []
+        stable_branches: Set[str] = set()
+
+        results = bodhi_client.query(packages=package_name, page=1)
+        done = self._add_updates(
+            updates, stable_branches, results["updates"], number_of_updates
+        )
+        # the latest updates come first, stop paging once we have enough
+        page = 1
+        while not done and page < results["pages"]:
             page += 1
-            pages = results["pages"]
+            results = bodhi_client.query(packages=package_name, page=page)
+            done = self._add_updates(
+                updates, stable_branches, results["updates"], number_of_updates
+            )
         logger.debug("Bodhi updates fetched.")
 
-        stable_branches: Set[str] = set()
-        all_updates = [
-            [
-                update["title"],
-                update["karma"],
-                update["status"],
-                update["release"]["branch"],
-            ]
-            for update in updates
-        ]
-        updates = []
-        for [update, karma, status, branch] in all_updates:
+        return updates
+
+    @staticmethod
+    def _add_updates(
+        updates: List[List],
+        stable_branches: Set[str],
+        new_updates: List[Dict],
+        number_of_updates: int,
+    ) -> bool:
+        """
+        Add the updates from one page of Bodhi results.
+
+        :param updates: updates collected so far, [title, karma, status]
+        :param stable_branches: branches with a stable update collected
+        :param new_updates: updates as returned by Bodhi
+        :param number_of_updates: number of updates to be collected
+        :return: whether enough updates were collected
+        """
+        for update in new_updates:
+            status = update["status"]
+            branch = update["release"]["branch"]
             # Don't return more than one stable update per branch
             if branch not in stable_branches or status != "stable":
-                updates.append([update, karma, status])
+                updates.append([update["title"], update["karma"], status])
                 if status == "stable":
                     stable_branches.add(branch)
             if len(updates) == number_of_updates:
-                break
-        return updates
+                return True
+        return False
 
     def get_copr_builds(self, number_of_builds: int = 5) -> List:
         return CoprHelper(upstream_local_project=self.up.local_project).get_copr_builds(
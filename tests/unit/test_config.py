@@ -1,6 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import os
 
 import pytest
@@ -15,6 +16,11 @@ from packit.config import (
     JobConfigTriggerType,
 )
 from packit.config.aliases import DEFAULT_VERSION
+from packit.config.job_config import get_default_jobs
+from packit.config.notifications import (
+    NotificationsConfig,
+    PullRequestNotificationsConfig,
+)
 from packit.schema import JobConfigSchema, JobMetadataSchema
 
 
@@ -109,6 +115,37 @@ def test_job_config_not_equal(job_config_simple, job_config_full):
     assert job_config_simple != job_config_full
 
 
+def test_job_config_not_equal_other_type(job_config_simple):
+    assert job_config_simple != "build"
+    assert job_config_simple in [None, job_config_simple]
+
+
+def test_job_config_equal_attributes():
+    job_config = get_job_config_simple(downstream_package_name="package")
+    # the lazily set dist-git URL is not compared
+    assert job_config.downstream_project_url
+    assert job_config == get_job_config_simple(downstream_package_name="package")
+    assert job_config != get_job_config_simple(
+        downstream_package_name="package",
+        notifications=NotificationsConfig(
+            pull_request=PullRequestNotificationsConfig(successful_build=True)
+        ),
+    )
+
+
+def test_job_config_repr(job_config_simple):
+    assert repr(job_config_simple) == "JobConfig(type='build', trigger='release')"
+    assert json.loads(job_config_simple.to_json())["job"] == "build"
+
+
+def test_get_default_jobs_not_shared():
+    default_jobs = get_default_jobs()
+    default_jobs[0]["targets"].append("fedora-rawhide")
+    default_jobs.pop()
+    assert get_default_jobs()[0]["targets"] == [DEFAULT_VERSION]
+    assert len(get_default_jobs()) == 3
+
+
 def test_job_config_blah():
     with pytest.raises(ValidationError) as ex:
         JobConfig.get_from_dict({"job": "asdqwe", "trigger": "salt"})
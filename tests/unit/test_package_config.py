@@ -1,6 +1,9 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
+import os
+from collections import OrderedDict
 from pathlib import Path, PosixPath
 from typing import Optional
 
@@ -21,6 +24,7 @@ from packit.config.package_config import (
     PackageConfig,
     get_local_specfile_path,
     get_local_package_config,
+    load_packit_yaml,
 )
 import packit.config.package_config
 from packit.config.sources import SourcesItem
@@ -1247,6 +1251,75 @@ def test_get_local_specfile_path():
     assert not get_local_specfile_path(SYNC_FILES)
 
 
+@pytest.fixture()
+def specfile_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(packit.config.package_config, "_SPECFILE_CACHE", cache)
+    return cache
+
+
+def test_get_local_specfile_path_cached(tmp_path, specfile_cache):
+    (tmp_path / "foo.spec").write_text("")
+    assert get_local_specfile_path(tmp_path) == "foo.spec"
+    assert list(specfile_cache.values()) == ["foo.spec"]
+
+    flexmock(PosixPath).should_receive("glob").never()
+    flexmock(PosixPath).should_receive("rglob").never()
+    assert get_local_specfile_path(tmp_path) == "foo.spec"
+
+
+def test_get_local_specfile_path_cached_relative_path(
+    tmp_path, monkeypatch, specfile_cache
+):
+    for name in ("foo", "bar"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.spec").write_text("")
+        # same mtime, only the location differs
+        os.utime(tmp_path / name, ns=(1, 1))
+
+    monkeypatch.chdir(tmp_path / "foo")
+    assert get_local_specfile_path(Path(".")) == "foo.spec"
+    monkeypatch.chdir(tmp_path / "bar")
+    assert get_local_specfile_path(Path(".")) == "bar.spec"
+
+
+def test_get_local_specfile_path_cache_invalidated(tmp_path, specfile_cache):
+    (tmp_path / "foo.spec").write_text("")
+    # set the mtime explicitly, file system timestamps can be coarse
+    os.utime(tmp_path, ns=(1, 1))
+    assert get_local_specfile_path(tmp_path) == "foo.spec"
+
+    (tmp_path / "foo.spec").unlink()
+    (tmp_path / "bar.spec").write_text("")
+    os.utime(tmp_path, ns=(2, 2))
+    assert get_local_specfile_path(tmp_path) == "bar.spec"
+
+    (tmp_path / "bar.spec").unlink()
+    os.utime(tmp_path, ns=(3, 3))
+    assert get_local_specfile_path(tmp_path) is None
+
+
+def test_get_local_specfile_path_recursive_not_cached(tmp_path, specfile_cache):
+    (tmp_path / "packaging").mkdir()
+    (tmp_path / "packaging" / "foo.spec").write_text("")
+    assert get_local_specfile_path(tmp_path) == "packaging/foo.spec"
+    assert not specfile_cache
+
+    # mtime of tmp_path doesn't change when a file in its subdirectory is removed
+    (tmp_path / "packaging" / "foo.spec").unlink()
+    assert get_local_specfile_path(tmp_path) is None
+
+
+def test_get_local_specfile_path_cache_size(tmp_path, specfile_cache, monkeypatch):
+    monkeypatch.setattr(packit.config.package_config, "_SPECFILE_CACHE_MAX_SIZE", 2)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.spec").write_text("")
+        assert get_local_specfile_path(tmp_path / name) == f"{name}.spec"
+
+    assert list(specfile_cache.values()) == ["b.spec", "c.spec"]
+
+
 @pytest.mark.parametrize(
     "directory, local_first,local_last,config_file_name,res_pc_path",
     [
@@ -1532,3 +1605,99 @@ def test_pc_dist_git_package_url_has_no_None(package_name, result):
         ).dist_git_package_url
         == result
     )
+
+
+def test_load_packit_yaml_cached(tmp_path):
+    config_file = tmp_path / ".packit.yaml"
+    config_file.write_text("specfile_path: foo.spec\n")
+
+    loaded_config = load_packit_yaml(config_file)
+    assert loaded_config == {"specfile_path": "foo.spec"}
+
+    # mutating the loaded config must not affect the cached one
+    loaded_config["specfile_path"] = "bar.spec"
+    assert load_packit_yaml(config_file) == {"specfile_path": "foo.spec"}
+
+    # a change of the file invalidates the cached content
+    config_file.write_text("specfile_path: foobar.spec\n")
+    assert load_packit_yaml(config_file) == {"specfile_path": "foobar.spec"}
+
+
+def test_load_packit_yaml_cached_relative_path(tmp_path, monkeypatch):
+    for name in ("foo", "bar"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / ".packit.yaml").write_text(f"specfile_path: {name}.spec\n")
+    # same size and mtime, only the location differs
+    stat = (tmp_path / "foo" / ".packit.yaml").stat()
+    os.utime(tmp_path / "bar" / ".packit.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    monkeypatch.chdir(tmp_path / "foo")
+    assert load_packit_yaml(Path(".packit.yaml")) == {"specfile_path": "foo.spec"}
+    monkeypatch.chdir(tmp_path / "bar")
+    assert load_packit_yaml(Path(".packit.yaml")) == {"specfile_path": "bar.spec"}
+
+
+def test_parse_config_file_json_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PACKIT_CONFIG_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    config_file = repo / ".packit.yaml"
+    config_file.write_text("specfile_path: foo.spec\n")
+
+    assert packit.config.package_config._parse_config_file(config_file) == {
+        "specfile_path": "foo.spec"
+    }
+    # nothing is written to the repository
+    assert list(repo.iterdir()) == [config_file]
+    (cache_file,) = (tmp_path / "cache" / "packit").iterdir()
+    stat = config_file.stat()
+    assert json.loads(cache_file.read_text()) == {
+        "stamp": [stat.st_mtime_ns, stat.st_size],
+        "content": {"specfile_path": "foo.spec"},
+    }
+    # readable by the owner only
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    # the cache is used as long as the mtime and size of the config match
+    cache_file.write_text(
+        json.dumps(
+            {
+                "stamp": [stat.st_mtime_ns, stat.st_size],
+                "content": {"specfile_path": "bar.spec"},
+            }
+        )
+    )
+    os.utime(cache_file, ns=(0, 0))
+    assert packit.config.package_config._parse_config_file(config_file) == {
+        "specfile_path": "bar.spec"
+    }
+
+    # the config is restored with an older mtime, e.g. by `cp -p`
+    config_file.write_text("specfile_path: foobar.spec\n")
+    os.utime(config_file, ns=(1, 1))
+    assert packit.config.package_config._parse_config_file(config_file) == {
+        "specfile_path": "foobar.spec"
+    }
+    assert json.loads(cache_file.read_text())["content"] == {
+        "specfile_path": "foobar.spec"
+    }
+
+    # same mtime, different size
+    config_file.write_text("specfile_path: foo.spec\n")
+    os.utime(config_file, ns=(1, 1))
+    assert packit.config.package_config._parse_config_file(config_file) == {
+        "specfile_path": "foo.spec"
+    }
+
+
+def test_parse_config_file_no_json_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("PACKIT_CONFIG_CACHE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config_file = tmp_path / ".packit.yaml"
+    config_file.write_text("specfile_path: foo.spec\n")
+
+    assert packit.config.package_config._parse_config_file(config_file) == {
+        "specfile_path": "foo.spec"
+    }
+    assert not (tmp_path / "cache").exists()
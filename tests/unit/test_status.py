@@ -1,6 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import koji
 from flexmock import flexmock
 
 from packit.status import Status
@@ -36,3 +37,64 @@ def test_status_updates(config_mock, package_config_mock, upstream_mock, distgit
         ["python-requre-0.8.1-2.fc33", 2, "stable"],
         ["python-requre-0.8.1-2.fc34", 3, "stable"],
     ]
+
+
+def test_status_updates_multiple_pages(
+    config_mock, package_config_mock, upstream_mock, distgit_mock
+):
+    requested_pages = []
+
+    def query(packages, page):
+        requested_pages.append(page)
+        return {
+            "updates": [
+                {
+                    "title": f"python-requre-0.8.{page}-1.fc34",
+                    "karma": page,
+                    "status": "testing",
+                    "release": {"branch": "f34"},
+                }
+            ],
+            "page": page,
+            "pages": 5,
+        }
+
+    flexmock(OurBodhiClient, query=query)
+
+    status = Status(config_mock, package_config_mock, upstream_mock, distgit_mock)
+    table = status.get_updates(number_of_updates=3)
+    assert table == [
+        ["python-requre-0.8.1-1.fc34", 1, "testing"],
+        ["python-requre-0.8.2-1.fc34", 2, "testing"],
+        ["python-requre-0.8.3-1.fc34", 3, "testing"],
+    ]
+    # pages 4 and 5 are not needed
+    assert requested_pages == [1, 2, 3]
+
+
+def test_status_koji_builds(
+    config_mock, package_config_mock, upstream_mock, distgit_mock
+):
+    def list_builds(packageID, state, completeAfter, queryOpts):
+        assert packageID == 42
+        # the latest build of each branch is the first one
+        assert queryOpts == {"order": "-completion_time"}
+        return [
+            {"nvr": "python-requre-0.8.2-1.fc34"},
+            {"nvr": "python-requre-0.8.1-2.fc33"},
+            {"nvr": "python-requre-0.8.1-1.fc34"},
+            {"nvr": "python-requre-0.8.0-1.fc33"},
+        ]
+
+    flexmock(koji.ClientSession).should_receive("__getattr__").with_args(
+        "getPackageID"
+    ).and_return(lambda name: 42)
+    flexmock(koji.ClientSession).should_receive("__getattr__").with_args(
+        "listBuilds"
+    ).and_return(list_builds).once()
+
+    status = Status(config_mock, package_config_mock, upstream_mock, distgit_mock)
+    assert status.get_koji_builds() == {
+        "fc34": "python-requre-0.8.2-1.fc34",
+        "fc33": "python-requre-0.8.1-2.fc33",
+    }